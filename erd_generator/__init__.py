@@ -12,11 +12,6 @@ __all__ = [
     "ParseFailure",
 ]
 
-from erd_generator.cli import main
-from erd_generator.drawio import build_drawio
-from erd_generator.sql_parser import load_schema_from_migrations, get_last_parse_failures, ParseFailure
-
-
 def __getattr__(name: str) -> Any:  # pragma: no cover - thin lazy loader
     if name == "main":
         return import_module("erd_generator.cli").main
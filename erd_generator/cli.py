@@ -1,73 +1,123 @@
 """Command line entry-point for generating draw.io ER diagrams."""
 from __future__ import annotations
 
-import argparse
-import os
 import sys
-import xml.etree.ElementTree as ET
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from .drawio import build_drawio
-from .fk_config import apply_foreign_key_config, load_foreign_key_config
-from .layout import LayoutConfig
-from .sql_parser import ParseFailure, get_last_parse_failures, load_schema_from_migrations
-
-
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Generate draw.io ERD from migration SQL files")
-    parser.add_argument("--migrations", required=True, help="Path to the root of migration SQL files")
-    parser.add_argument("--out", required=True, help="Path to the output .drawio file")
-    parser.add_argument("--show-types", action="store_true", help="Append column types to labels")
-    parser.add_argument(
-        "--per-row",
-        type=int,
-        default=0,
-        help="Tables per row (0 = auto based on graph, default: 0)",
-    )
-    parser.add_argument(
-        "--log-dir",
-        help="Optional root directory for parse logs; logs will be written under <log-dir>/parse_log "
-        "(default: ./parse_log relative to the current working directory).",
-    )
-    parser.add_argument(
-        "--fk-config",
-        help="Optional YAML file describing additional foreign key links to inject before rendering.",
-    )
-    parser.add_argument(
-        "--layout",
-        choices=["grid", "graphviz"],
-        default="grid",
-        help="Layout algorithm to position tables (default: grid).",
-    )
-    parser.add_argument(
-        "--graphviz-prog",
-        default="dot",
-        help="Graphviz engine to use when --layout graphviz (default: dot).",
-    )
-    parser.add_argument(
-        "--graphviz-scale",
-        type=float,
-        default=1.0,
-        help="Scale factor applied to Graphviz coordinates; increase for more spacing (default: 1.0).",
-    )
-    parser.add_argument(
-        "--graphviz-spacing",
-        type=float,
-        default=200.0,
-        help="Additional uniform spacing (in draw.io units) added to Graphviz coordinates to reduce overlap (default: 200).",
-    )
-    return parser
-
-
-def _print_failure_summary(failures: list[ParseFailure]) -> None:
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # heavy imports are deferred to run_cli for startup latency
+    from .sql_parser import ParseFailure
+
+# argparse costs tens of milliseconds of import and setup on every cold start,
+# which adds up when the tool runs per migration set in CI. The fixed option
+# set below is parsed by hand instead: flag -> (dest, type, default).
+_PROG = "gen_drawio_erd_table.py"
+_OPTIONS: dict[str, tuple[str, type, object]] = {
+    "--migrations": ("migrations", str, None),
+    "--out": ("out", str, None),
+    "--per-row": ("per_row", int, 0),
+    "--log-dir": ("log_dir", str, None),
+    "--fk-config": ("fk_config", str, None),
+    "--layout": ("layout", str, "grid"),
+    "--graphviz-prog": ("graphviz_prog", str, "dot"),
+    "--graphviz-scale": ("graphviz_scale", float, 1.0),
+    "--graphviz-spacing": ("graphviz_spacing", float, 200.0),
+}
+_FLAGS: dict[str, str] = {"--show-types": "show_types"}
+_REQUIRED = ("--migrations", "--out")
+_CHOICES: dict[str, tuple[str, ...]] = {"--layout": ("grid", "graphviz")}
+
+_USAGE = f"""usage: {_PROG} --migrations MIGRATIONS --out OUT [--show-types]
+       [--per-row PER_ROW] [--log-dir LOG_DIR] [--fk-config FK_CONFIG]
+       [--layout {{grid,graphviz}}] [--graphviz-prog GRAPHVIZ_PROG]
+       [--graphviz-scale GRAPHVIZ_SCALE] [--graphviz-spacing GRAPHVIZ_SPACING]
+
+Generate draw.io ERD from migration SQL files
+
+options:
+  -h, --help            show this help message and exit
+  --migrations MIGRATIONS
+                        Path to the root of migration SQL files
+  --out OUT             Path to the output .drawio file
+  --show-types          Append column types to labels
+  --per-row PER_ROW     Tables per row (0 = auto based on graph, default: 0)
+  --log-dir LOG_DIR     Optional root directory for parse logs; logs will be
+                        written under <log-dir>/parse_log (default: ./parse_log
+                        relative to the current working directory).
+  --fk-config FK_CONFIG
+                        Optional YAML file describing additional foreign key
+                        links to inject before rendering.
+  --layout {{grid,graphviz}}
+                        Layout algorithm to position tables (default: grid).
+  --graphviz-prog GRAPHVIZ_PROG
+                        Graphviz engine to use when --layout graphviz
+                        (default: dot).
+  --graphviz-scale GRAPHVIZ_SCALE
+                        Scale factor applied to Graphviz coordinates; increase
+                        for more spacing (default: 1.0).
+  --graphviz-spacing GRAPHVIZ_SPACING
+                        Additional uniform spacing (in draw.io units) added to
+                        Graphviz coordinates to reduce overlap (default: 200).
+"""
+
+
+def _cli_error(message: str) -> "SystemExit":
+    sys.stderr.write(f"{_PROG}: error: {message}\n")
+    return SystemExit(2)
+
+
+def parse_args(argv: list[str] | None = None) -> SimpleNamespace:
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    values = {dest: default for dest, _, default in _OPTIONS.values()}
+    values.update({dest: False for dest in _FLAGS.values()})
+    seen: set[str] = set()
+
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+        if token in ("-h", "--help"):
+            sys.stdout.write(_USAGE)
+            raise SystemExit(0)
+        if token in _FLAGS:
+            values[_FLAGS[token]] = True
+            continue
+        flag, _, inline_value = token.partition("=")
+        option = _OPTIONS.get(flag)
+        if option is None:
+            raise _cli_error(f"unrecognized argument: {token}")
+        if not inline_value:
+            if index >= len(tokens):
+                raise _cli_error(f"argument {flag}: expected one argument")
+            inline_value = tokens[index]
+            index += 1
+        dest, value_type, _ = option
+        try:
+            values[dest] = value_type(inline_value)
+        except ValueError:
+            raise _cli_error(f"argument {flag}: invalid {value_type.__name__} value: '{inline_value}'")
+        choices = _CHOICES.get(flag)
+        if choices and values[dest] not in choices:
+            raise _cli_error(
+                f"argument {flag}: invalid choice: '{inline_value}' (choose from {', '.join(choices)})"
+            )
+        seen.add(flag)
+
+    missing = [flag for flag in _REQUIRED if flag not in seen]
+    if missing:
+        raise _cli_error(f"the following arguments are required: {', '.join(missing)}")
+    return SimpleNamespace(**values)
+
+
+def _print_failure_summary(failures: "list[ParseFailure]") -> None:
     if not failures:
         return
-    print("\nUnsupported SQL statements:")
-    for failure in failures:
-        location = failure.source or "<input>"
-        print(f" - {location}: {failure.reason}: {failure.sql}")
+    lines = ["\nUnsupported SQL statements:"]
+    lines.extend(
+        f" - {failure.source or '<input>'}: {failure.reason}: {failure.sql}" for failure in failures
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _resolve_log_directory(log_root: Optional[str]) -> Path:
@@ -77,22 +127,33 @@ def _resolve_log_directory(log_root: Optional[str]) -> Path:
     return target_dir
 
 
-def _write_failure_log(failures: list[ParseFailure], log_root: Optional[str]) -> None:
+def _write_failure_log(failures: "list[ParseFailure]", log_root: Optional[str]) -> None:
     if not failures:
         return
+    from datetime import datetime
+
     directory = _resolve_log_directory(log_root)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     log_path = directory / f"parse_failures_{timestamp}.log"
 
+    entries = [
+        f"{failure.source or '<input>'}\n  {failure.reason}: {failure.sql}" for failure in failures
+    ]
     with log_path.open("w", encoding="utf-8") as handle:
-        handle.write(f"Parse failures collected at {datetime.now().isoformat()}\n\n")
-        for failure in failures:
-            location = failure.source or "<input>"
-            handle.write(f"{location}\n  {failure.reason}: {failure.sql}\n")
+        handle.write(
+            f"Parse failures collected at {datetime.now().isoformat()}\n\n" + "\n".join(entries) + "\n"
+        )
 
     print(f"Parse log written to {log_path}")
 
-def run_cli(args: argparse.Namespace) -> int:
+def run_cli(args: SimpleNamespace) -> int:
+    # Imported here so `--help` and argument errors do not pay for sqlglot,
+    # networkx, and the XML stack.
+    from .drawio import ET, build_drawio
+    from .fk_config import apply_foreign_key_config, load_foreign_key_config
+    from .layout import LayoutConfig
+    from .sql_parser import get_last_parse_failures, load_schema_from_migrations
+
     schema = load_schema_from_migrations(args.migrations)
     failures = get_last_parse_failures()
     config_entries, config_source = load_foreign_key_config(args.fk_config, failures)
@@ -115,10 +176,11 @@ def run_cli(args: argparse.Namespace) -> int:
     except AttributeError:
         pass
 
-    output_dir = os.path.dirname(os.path.abspath(args.out))
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-    tree.write(args.out, encoding="utf-8", xml_declaration=False)
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # A 1 MiB buffer keeps syscall counts low when serialising MB-scale XML.
+    with out_path.open("wb", buffering=1024 * 1024) as handle:
+        tree.write(handle, encoding="utf-8", xml_declaration=False)
     print(f"Diagram written to {args.out}")
 
     _print_failure_summary(failures)
@@ -128,9 +190,7 @@ def run_cli(args: argparse.Namespace) -> int:
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    return run_cli(args)
+    return run_cli(parse_args(argv))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,15 +1,31 @@
 """Build draw.io XML documents from schema metadata."""
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import itertools
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Dict, Optional, Tuple
 from xml.sax.saxutils import escape
 
+try:  # lxml's libxml2 backend builds/serialises large trees much faster.
+    from lxml import etree as ET  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on local environment
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+
 from .layout import LayoutConfig, TableLayout, layout_tables
 from .schema import Column, ForeignKey, Schema, Table
 
 
 class IdGenerator:
+    """Sequential mx-cell id factory (kept for API compatibility).
+
+    ``build_drawio`` now uses a bare ``itertools.count`` internally, which
+    avoids a Python method dispatch per generated id.
+    """
+
+    __slots__ = ("_value",)
+
     def __init__(self, start: int = 2) -> None:
         self._value = start
 
@@ -34,6 +50,7 @@ CELL_LEFT_STYLE = (
     "shape=partialRectangle;connectable=0;fillColor=none;top=0;left=0;bottom=0;right=0;"
     "editable=1;overflow=hidden;fontStyle=1"
 )
+CELL_LEFT_STYLE_NOBOLD = CELL_LEFT_STYLE.replace("fontStyle=1", "")
 CELL_RIGHT_STYLE = (
     "shape=partialRectangle;connectable=1;fillColor=none;top=0;left=0;bottom=0;right=0;"
     "align=left;spacingLeft=6;overflow=hidden;portConstraint=eastwest;"
@@ -48,17 +65,135 @@ NOTE_STYLE = (
 )
 
 
+_ATTR_ESCAPES = {'"': "&quot;"}
+# SQL identifiers and type labels rarely contain markup; characters outside
+# this set are the only ones that could need XML escaping.
+_UNSAFE_CHAR = re.compile(r"[^A-Za-z0-9_ (),.]").search
+
+
+def _attr(value: str) -> str:
+    """Escape a string for embedding inside a double-quoted XML attribute."""
+    if _UNSAFE_CHAR(value) is None:
+        return value
+    return escape(value, _ATTR_ESCAPES)
+
+
 def _render_table_label(table: Table) -> str:
-    return escape(table.name.upper())
+    label = table.name.upper()
+    if _UNSAFE_CHAR(label) is None:
+        return label
+    return escape(label)
 
 
-def _render_column_label(column: Column, show_types: bool) -> str:
-    label = column.name.upper()
-    if show_types and column.data_type:
-        label = f"{label} ({column.data_type})"
+@lru_cache(maxsize=4096)
+def _render_label_text(name: str, data_type: Optional[str]) -> str:
+    """Render (and escape) one upper-cased label, memoised across tables.
+
+    Column names and type spellings repeat heavily across a schema
+    (``id (bigint)``, ``created_at (timestamptz)``, ...), so caching the
+    rendered string amortises the upper-casing and escaping work.
+    """
+    label = name.upper()
+    if data_type:
+        label = f"{label} ({data_type})"
+    if _UNSAFE_CHAR(label) is None:
+        return label
     return escape(label)
 
 
+def _render_column_label(column: Column, show_types: bool) -> str:
+    return _render_label_text(column.name, column.data_type if show_types else None)
+
+
+# Below this many tables the pickling overhead of a worker pool outweighs the
+# parallel rendering win, so the fragments are built serially.
+_PARALLEL_TABLE_THRESHOLD = 200
+
+
+def _build_table_xml(
+    layout: TableLayout,
+    start_index: int,
+    config: LayoutConfig,
+    show_types: bool,
+    row_height_str: Optional[str] = None,
+) -> str:
+    """Render one table (group, table, rows, optional note) as an XML fragment.
+
+    ``start_index`` is the first mx-cell index for this table; ids are assigned
+    in the same deterministic order ``build_drawio`` uses to populate its
+    table/column id maps, which is what makes the per-table rendering
+    independent and safe to run in worker processes.
+    """
+    table = layout.table
+    total_height = layout.height + (layout.note_height if layout.note_lines else 0.0)
+    next_index = itertools.count(start_index).__next__
+    parts: list[str] = []
+
+    # Geometry strings that repeat on every row are loop-invariant per
+    # table; the layout carries its own pre-rendered ones.
+    y_offset = config.header_height
+    row_height = config.row_height
+    if row_height_str is None:
+        row_height_str = f"{row_height:.2f}"
+    width_str = layout.width_str
+    right_width_str = f"{layout.width - 30:.2f}"
+
+    group_id = f"mx{next_index()}"
+    parts.append(
+        f'<mxCell id="{group_id}" value="" style="group" vertex="1" connectable="0" parent="1">'
+        f'<mxGeometry x="{layout.x_str}" y="{layout.y_str}" width="{width_str}" '
+        f'height="{max(total_height, 1.0):.2f}" as="geometry"/></mxCell>'
+    )
+
+    table_id = f"mx{next_index()}"
+    parts.append(
+        f'<mxCell id="{table_id}" value="{_attr(_render_table_label(table))}" '
+        f'style="{TABLE_STYLE}" vertex="1" parent="{group_id}">'
+        f'<mxGeometry x="0" y="0" width="{width_str}" height="{layout.height_str}" as="geometry">'
+        f'<mxRectangle x="80" y="10" width="50" height="30" as="alternateBounds"/>'
+        f"</mxGeometry></mxCell>"
+    )
+    for index, column in enumerate(table.columns):
+        row_id = f"mx{next_index()}"
+        parts.append(
+            f'<mxCell id="{row_id}" value="" style="{ROW_STYLE}" vertex="1" parent="{table_id}">'
+            f'<mxGeometry y="{y_offset + index * row_height:.2f}" width="{width_str}" '
+            f'height="{row_height_str}" as="geometry"/></mxCell>'
+        )
+
+        left_id = f"mx{next_index()}"
+        left_label = "PK" if column.is_primary_key else ""
+        left_style = CELL_LEFT_STYLE if left_label else CELL_LEFT_STYLE_NOBOLD
+        # alternateBounds only matters for collapsible shapes, so the table
+        # keeps its rectangle while the plain row cells skip the extra element.
+        parts.append(
+            f'<mxCell id="{left_id}" value="{left_label}" style="{left_style}" vertex="1" parent="{row_id}">'
+            f'<mxGeometry width="30" height="{row_height_str}" as="geometry"/></mxCell>'
+        )
+
+        right_id = f"mx{next_index()}"
+        parts.append(
+            f'<mxCell id="{right_id}" value="{_attr(_render_column_label(column, show_types))}" '
+            f'style="{CELL_RIGHT_STYLE}" vertex="1" parent="{row_id}">'
+            f'<mxGeometry x="30" width="{right_width_str}" height="{row_height_str}" as="geometry"/>'
+            f"</mxCell>"
+        )
+
+    if layout.note_lines:
+        margin = config.index_note_margin
+        content_height = layout.note_height - margin
+        note_value = "<br/>".join(escape(line) for line in layout.note_lines)
+        note_id = f"mx{next_index()}"
+        parts.append(
+            f'<mxCell id="{note_id}" value="{_attr(note_value)}" style="{NOTE_STYLE}" '
+            f'vertex="1" parent="{group_id}">'
+            f'<mxGeometry x="0" y="{layout.height + margin:.2f}" width="{width_str}" '
+            f'height="{max(content_height, 1.0):.2f}" as="geometry"/></mxCell>'
+        )
+
+    return f"<cells>{''.join(parts)}</cells>"
+
+
 def build_drawio(schema: Schema, show_types: bool = False, layout_config: LayoutConfig | None = None) -> ET.ElementTree:
     config = layout_config or LayoutConfig()
     layouts = layout_tables(schema, config)
@@ -97,192 +232,55 @@ def build_drawio(schema: Schema, show_types: bool = False, layout_config: Layout
     ET.SubElement(root, "mxCell", {"id": "0"})
     ET.SubElement(root, "mxCell", {"id": "1", "parent": "0"})
 
-    ids = IdGenerator()
+    # Cell ids are allocated deterministically per table (group, table, then
+    # row/left/right per column, plus an optional note), so each table's
+    # fragment can be rendered independently — serially or in a worker pool.
+    starts: list[int] = []
+    counter = 3
+    for layout in layouts:
+        starts.append(counter)
+        counter += 2 + 3 * len(layout.table.columns) + (1 if layout.note_lines else 0)
+    next_index = itertools.count(counter).__next__
+
     table_id_map: Dict[str, str] = {}
     column_cell_ids: Dict[Tuple[str, str], str] = {}
-
-    for layout in layouts:
+    for layout, start in zip(layouts, starts):
         table = layout.table
-        total_height = layout.height + (layout.note_height if layout.note_lines else 0.0)
-
-        group_id = ids.next()
-        group_cell = ET.SubElement(
-            root,
-            "mxCell",
-            {
-                "id": group_id,
-                "value": "",
-                "style": "group",
-                "vertex": "1",
-                "connectable": "0",
-                "parent": "1",
-            },
-        )
-        ET.SubElement(
-            group_cell,
-            "mxGeometry",
-            {
-                "x": f"{layout.x:.2f}",
-                "y": f"{layout.y:.2f}",
-                "width": f"{layout.width:.2f}",
-                "height": f"{max(total_height, 1.0):.2f}",
-                "as": "geometry",
-            },
-        )
-
-        table_id = ids.next()
-        table_id_map[table.name] = table_id
-        table_cell = ET.SubElement(
-            root,
-            "mxCell",
-            {
-                "id": table_id,
-                "value": _render_table_label(table),
-                "style": TABLE_STYLE,
-                "vertex": "1",
-                "parent": group_id,
-            },
-        )
-        geometry = ET.SubElement(
-            table_cell,
-            "mxGeometry",
-            {
-                "x": "0",
-                "y": "0",
-                "width": f"{layout.width:.2f}",
-                "height": f"{layout.height:.2f}",
-                "as": "geometry",
-            },
-        )
-        ET.SubElement(
-            geometry,
-            "mxRectangle",
-            {
-                "x": "80",
-                "y": "10",
-                "width": "50",
-                "height": "30",
-                "as": "alternateBounds",
-            },
-        )
-
-        y_offset = config.header_height
+        table_id_map[table.name] = f"mx{start + 1}"
         for index, column in enumerate(table.columns):
-            row_id = ids.next()
-            row_cell = ET.SubElement(
-                root,
-                "mxCell",
-                {
-                    "id": row_id,
-                    "value": "",
-                    "style": ROW_STYLE,
-                    "vertex": "1",
-                    "parent": table_id,
-                },
-            )
-            ET.SubElement(
-                row_cell,
-                "mxGeometry",
-                {
-                    "y": f"{y_offset + index * config.row_height:.2f}",
-                    "width": f"{layout.width:.2f}",
-                    "height": f"{config.row_height:.2f}",
-                    "as": "geometry",
-                },
-            )
+            column_cell_ids[(table.name, column.name.lower())] = f"mx{start + 4 + 3 * index}"
 
-            left_id = ids.next()
-            left_label = "PK" if column.is_primary_key else ""
-            left_style = CELL_LEFT_STYLE if left_label else CELL_LEFT_STYLE.replace("fontStyle=1", "")
-            left_cell = ET.SubElement(
-                root,
-                "mxCell",
-                {
-                    "id": left_id,
-                    "value": left_label,
-                    "style": left_style,
-                    "vertex": "1",
-                    "parent": row_id,
-                },
-            )
-            ET.SubElement(
-                left_cell,
-                "mxGeometry",
-                {
-                    "width": "30",
-                    "height": f"{config.row_height:.2f}",
-                    "as": "geometry",
-                },
-            )
-            ET.SubElement(
-                left_cell,
-                "mxRectangle",
-                {"width": "30", "height": f"{config.row_height:.2f}", "as": "alternateBounds"},
-            )
-
-            right_id = ids.next()
-            right_cell = ET.SubElement(
-                root,
-                "mxCell",
-                {
-                    "id": right_id,
-                    "value": _render_column_label(column, show_types),
-                    "style": CELL_RIGHT_STYLE,
-                    "vertex": "1",
-                    "parent": row_id,
-                },
-            )
-            ET.SubElement(
-                right_cell,
-                "mxGeometry",
-                {
-                    "x": "30",
-                    "width": f"{layout.width - 30:.2f}",
-                    "height": f"{config.row_height:.2f}",
-                    "as": "geometry",
-                },
-            )
-            ET.SubElement(
-                right_cell,
-                "mxRectangle",
-                {
-                    "width": f"{layout.width - 30:.2f}",
-                    "height": f"{config.row_height:.2f}",
-                    "as": "alternateBounds",
-                },
-            )
-            column_cell_ids[(table.name, column.name.lower())] = right_id
-
-        if layout.note_lines:
-            margin = config.index_note_margin
-            content_height = layout.note_height - margin
-            note_value = "<br/>".join(escape(line) for line in layout.note_lines)
-            note_id = ids.next()
-            note_cell = ET.SubElement(
-                root,
-                "mxCell",
-                {
-                    "id": note_id,
-                    "value": note_value,
-                    "style": NOTE_STYLE,
-                    "vertex": "1",
-                    "parent": group_id,
-                },
-            )
-            ET.SubElement(
-                note_cell,
-                "mxGeometry",
-                {
-                    "x": "0",
-                    "y": f"{layout.height + margin:.2f}",
-                    "width": f"{layout.width:.2f}",
-                    "height": f"{max(content_height, 1.0):.2f}",
-                    "as": "geometry",
-                },
+    # Config-derived strings are identical for every table, so render them
+    # once here instead of once per table.
+    row_height_str = f"{config.row_height:.2f}"
+    if len(layouts) > _PARALLEL_TABLE_THRESHOLD:
+        builder = partial(
+            _build_table_xml, config=config, show_types=show_types, row_height_str=row_height_str
+        )
+        with ProcessPoolExecutor() as pool:
+            fragments = list(pool.map(builder, layouts, starts, chunksize=32))
+    else:
+        fragments = [
+            _build_table_xml(
+                layout, start, config=config, show_types=show_types, row_height_str=row_height_str
             )
+            for layout, start in zip(layouts, starts)
+        ]
+    for fragment in fragments:
+        root.extend(ET.fromstring(fragment))
 
-    for table_name in sorted(schema.keys()):
-        table = schema[table_name]
+    # Collect all FK edges as fragments and parse them with one call at the
+    # end, mirroring the bulk table emission above.
+    # Lower-cased primary keys are needed repeatedly while resolving edge
+    # targets; compute them once per table instead of per FK pair.
+    pk_lower_cache: Dict[str, list[str]] = {
+        name: sorted(col.lower() for col in table.primary_key) for name, table in schema.items()
+    }
+    # layout_tables already yields tables in a deterministic order, so walk
+    # the layouts instead of re-sorting schema.keys() a second time.
+    edge_parts: list[str] = []
+    for layout in layouts:
+        table = layout.table
         source_id = table_id_map.get(table.name)
         if not source_id:
             continue
@@ -290,8 +288,8 @@ def build_drawio(schema: Schema, show_types: bool = False, layout_config: Layout
             target_table_id = table_id_map.get(fk.ref_table)
             if not target_table_id:
                 continue
-            local_columns = list(fk.columns)
-            ref_columns = list(fk.ref_columns)
+            local_columns = [col.lower() for col in fk.columns]
+            ref_columns = [col.lower() for col in fk.ref_columns]
             pairs: list[Tuple[str, Optional[str]]] = []
             if ref_columns and len(ref_columns) == len(local_columns):
                 pairs = list(zip(local_columns, ref_columns))
@@ -301,15 +299,14 @@ def build_drawio(schema: Schema, show_types: bool = False, layout_config: Layout
                 pairs = [(col, None) for col in local_columns]
 
             for local_col, ref_col in pairs:
-                source_cell = column_cell_ids.get((table.name, local_col.lower()))
-                target_cell = column_cell_ids.get((fk.ref_table, (ref_col or "").lower())) if ref_col else None
+                source_cell = column_cell_ids.get((table.name, local_col))
+                target_cell = column_cell_ids.get((fk.ref_table, ref_col)) if ref_col else None
                 if not target_cell and fk.ref_table in schema:
-                    ref_table = schema[fk.ref_table]
                     candidates = []
                     if ref_col:
-                        candidates.append(ref_col.lower())
-                    candidates.append(local_col.lower())
-                    candidates.extend(col.lower() for col in sorted(ref_table.primary_key))
+                        candidates.append(ref_col)
+                    candidates.append(local_col)
+                    candidates.extend(pk_lower_cache[fk.ref_table])
                     for candidate in candidates:
                         hit = column_cell_ids.get((fk.ref_table, candidate))
                         if hit:
@@ -318,20 +315,13 @@ def build_drawio(schema: Schema, show_types: bool = False, layout_config: Layout
 
                 source_ref = source_cell or source_id
                 target_ref = target_cell or target_table_id
-                edge_id = ids.next()
-                edge_cell = ET.SubElement(
-                    root,
-                    "mxCell",
-                    {
-                        "id": edge_id,
-                        "value": "",
-                        "style": EDGE_STYLE,
-                        "edge": "1",
-                        "parent": "1",
-                        "source": source_ref,
-                        "target": target_ref,
-                    },
+                edge_parts.append(
+                    f'<mxCell id="mx{next_index()}" value="" style="{EDGE_STYLE}" edge="1" '
+                    f'parent="1" source="{source_ref}" target="{target_ref}">'
+                    f'<mxGeometry relative="1" as="geometry"/></mxCell>'
                 )
-                ET.SubElement(edge_cell, "mxGeometry", {"relative": "1", "as": "geometry"})
+
+    if edge_parts:
+        root.extend(ET.fromstring(f"<cells>{''.join(edge_parts)}</cells>"))
 
     return ET.ElementTree(mxfile)
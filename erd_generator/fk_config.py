@@ -1,7 +1,9 @@
 """Helpers for loading and applying foreign-key overrides from YAML."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Optional, Tuple
 
@@ -19,11 +21,15 @@ class ForeignKeyConfigEntry:
     reference_columns: Tuple[str, ...]
 
 
+# Identifiers repeat across config entries and schemas; memoising and
+# interning the normalised form dedupes the allocations and lets later dict
+# lookups hit on pointer equality.
+@lru_cache(maxsize=8192)
 def _normalize_identifier(value: str) -> str:
     text = value.strip()
     if len(text) >= 2 and text.startswith('"') and text.endswith('"'):
-        return text[1:-1]
-    return text.lower()
+        return sys.intern(text[1:-1])
+    return sys.intern(text.lower())
 
 
 def _normalize_column_sequence(value: Any) -> Optional[Tuple[str, ...]]:
@@ -55,6 +61,12 @@ def _warn(source: Optional[str], message: str) -> None:
     print(f"{prefix}: {message}")
 
 
+# Parsed configs keyed by (path, mtime_ns, size) so repeated invocations in
+# the same process (e.g. regenerating several diagrams from a wrapper script)
+# pay for the YAML parse only once per file version.
+_CONFIG_CACHE: dict[tuple[str, int, int], list[ForeignKeyConfigEntry]] = {}
+
+
 def load_foreign_key_config(
     config_path: Optional[str],
     failures: Optional[list[ParseFailure]],
@@ -72,26 +84,16 @@ def load_foreign_key_config(
         )
         return [], source
     try:
-        import yaml  # type: ignore[import-not-found]
-    except ImportError:
-        _record_config_failure(
-            failures,
-            source,
-            "Foreign key config error",
-            "PyYAML is not installed",
-        )
-        return [], source
+        stat = path.stat()
+        cache_key = (source, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached), source
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            raw_config = yaml.safe_load(handle)
-    except yaml.YAMLError as exc:
-        _record_config_failure(
-            failures,
-            source,
-            "Foreign key config parse error",
-            str(exc),
-        )
-        return [], source
+        data = path.read_text(encoding="utf-8")
     except OSError as exc:
         _record_config_failure(
             failures,
@@ -100,6 +102,53 @@ def load_foreign_key_config(
             str(exc),
         )
         return [], source
+    # JSON is valid YAML but the stdlib C parser is much faster, so configs
+    # with a .json suffix or a JSON-looking first character try it first. A
+    # decode error is only fatal for an actual .json file; flow-style YAML
+    # also starts with "{" or "[", so other suffixes fall back to PyYAML.
+    is_json_suffix = path.suffix.lower() == ".json"
+    raw_config: Any = None
+    parsed = False
+    if is_json_suffix or data.lstrip()[:1] in ("{", "["):
+        import json
+
+        try:
+            raw_config = json.loads(data)
+            parsed = True
+        except json.JSONDecodeError as exc:
+            if is_json_suffix:
+                _record_config_failure(
+                    failures,
+                    source,
+                    "Foreign key config parse error",
+                    str(exc),
+                )
+                return [], source
+    if not parsed:
+        try:
+            import yaml  # type: ignore[import-not-found]
+        except ImportError:
+            _record_config_failure(
+                failures,
+                source,
+                "Foreign key config error",
+                "PyYAML is not installed",
+            )
+            return [], source
+        try:  # libyaml bindings parse several times faster than the pure-Python loader
+            from yaml import CSafeLoader as _YamlLoader  # type: ignore[attr-defined]
+        except ImportError:  # pragma: no cover - depends on how PyYAML was built
+            from yaml import SafeLoader as _YamlLoader
+        try:
+            raw_config = yaml.load(data, Loader=_YamlLoader)
+        except yaml.YAMLError as exc:
+            _record_config_failure(
+                failures,
+                source,
+                "Foreign key config parse error",
+                str(exc),
+            )
+            return [], source
     if raw_config is None:
         return [], source
     if not isinstance(raw_config, dict):
@@ -193,6 +242,8 @@ def load_foreign_key_config(
                     reference_columns=reference_columns,
                 )
             )
+    if cache_key is not None:
+        _CONFIG_CACHE[cache_key] = list(entries)
     return entries, source
 
 
@@ -201,7 +252,7 @@ class _SchemaLookup:
         self._direct: dict[str, Table] = {}
         self._suffix: dict[str, Table] = {}
         for name, table in schema.items():
-            lowered = name.lower()
+            lowered = sys.intern(name.lower())
             self._direct[lowered] = table
             suffix = lowered.rsplit(".", 1)[-1]
             self._suffix.setdefault(suffix, table)
@@ -217,6 +268,25 @@ class _SchemaLookup:
         return self._suffix.get(suffix)
 
 
+# Schema dicts are not weak-referenceable, so the memo is keyed by id() and
+# validated against a fingerprint of the schema's (name, table) pairs; any
+# rename, addition or removal changes the fingerprint and forces a rebuild.
+# A single slot covers the repeated-apply case without pinning Tables from
+# schemas the caller has long since dropped.
+_LOOKUP_CACHE: Optional[Tuple[int, Tuple[Tuple[str, int], ...], _SchemaLookup]] = None
+
+
+def _schema_lookup(schema: Schema) -> _SchemaLookup:
+    global _LOOKUP_CACHE
+    fingerprint = tuple((name, id(table)) for name, table in schema.items())
+    cached = _LOOKUP_CACHE
+    if cached is not None and cached[0] == id(schema) and cached[1] == fingerprint:
+        return cached[2]
+    lookup = _SchemaLookup(schema)
+    _LOOKUP_CACHE = (id(schema), fingerprint, lookup)
+    return lookup
+
+
 def _resolve_columns(table: Table, columns: Iterable[str]) -> tuple[str, ...]:
     resolved: list[str] = []
     for column_name in columns:
@@ -225,22 +295,16 @@ def _resolve_columns(table: Table, columns: Iterable[str]) -> tuple[str, ...]:
     return tuple(resolved)
 
 
-def _foreign_key_exists(table: Table, candidate: ForeignKey) -> bool:
-    return any(
-        fk.columns == candidate.columns
-        and fk.ref_table == candidate.ref_table
-        and fk.ref_columns == candidate.ref_columns
-        for fk in table.foreign_keys
-    )
-
-
 def apply_foreign_key_config(
     schema: Schema,
     entries: Iterable[ForeignKeyConfigEntry],
     *,
     config_source: Optional[str] = None,
 ) -> None:
-    lookup = _SchemaLookup(schema)
+    lookup = _schema_lookup(schema)
+    # Fallback key sets for table-like objects that do not expose the
+    # maintained foreign_key_keys() index.
+    fk_keys: dict[int, set[tuple]] = {}
     for entry in entries:
         table = lookup.resolve(entry.normalized_table)
         if not table:
@@ -264,11 +328,24 @@ def apply_foreign_key_config(
             reference_columns = entry.reference_columns
             reference_table_name = entry.normalized_reference_table
 
-        candidate = ForeignKey(
-            columns=local_columns,
-            ref_table=reference_table_name,
-            ref_columns=reference_columns,
-        )
-        if _foreign_key_exists(table, candidate):
+        key_accessor = getattr(table, "foreign_key_keys", None)
+        if key_accessor is not None:
+            # Table maintains this set across add_foreign_key calls, so
+            # repeated config applications skip the rebuild entirely.
+            existing = key_accessor()
+        else:
+            existing = fk_keys.setdefault(
+                id(table),
+                {(fk.columns, fk.ref_table, fk.ref_columns) for fk in table.foreign_keys},
+            )
+        candidate_key = (local_columns, reference_table_name, reference_columns)
+        if candidate_key in existing:
             continue
-        table.add_foreign_key(candidate)
+        existing.add(candidate_key)
+        table.add_foreign_key(
+            ForeignKey(
+                columns=local_columns,
+                ref_table=reference_table_name,
+                ref_columns=reference_columns,
+            )
+        )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Callable
 
 import networkx as nx
@@ -41,6 +41,18 @@ class TableLayout:
     height: float
     note_lines: List[str]
     note_height: float
+    # 2dp string forms of the geometry, rendered once here instead of being
+    # re-formatted for every cell that embeds them.
+    x_str: str = field(init=False)
+    y_str: str = field(init=False)
+    width_str: str = field(init=False)
+    height_str: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.x_str = f"{self.x:.2f}"
+        self.y_str = f"{self.y:.2f}"
+        self.width_str = f"{self.width:.2f}"
+        self.height_str = f"{self.height:.2f}"
 
     @property
     def total_rows(self) -> int:
@@ -127,11 +139,20 @@ def _layout_with_grid(
     auto_per_row = max(1, int(math.sqrt(len(schema))))
     chunk_size = config.per_row if config.per_row > 0 else auto_per_row
 
-    ordered_rows: List[List[str]] = []
+    # Resolve each table's entry (table, height, note lines/height) exactly
+    # once while chunking into rows; the placement loop below then walks the
+    # tuples without any further per-table dict lookups.
+    _RowEntry = Tuple[Table, float, List[str], float]
+    ordered_rows: List[List[_RowEntry]] = []
     for level in sorted(tables_by_level.keys()):
         names = sorted(tables_by_level[level])
         for idx in range(0, len(names), chunk_size):
-            ordered_rows.append(names[idx : idx + chunk_size])
+            ordered_rows.append(
+                [
+                    (schema[name], table_heights[name], *note_info[name])
+                    for name in names[idx : idx + chunk_size]
+                ]
+            )
 
     if not ordered_rows:
         return []
@@ -147,19 +168,17 @@ def _layout_with_grid(
     current_y = float(config.padding_y)
 
     for row, row_width in zip(ordered_rows, row_widths):
-        row_height = max(table_heights[name] + note_info[name][1] for name in row)
+        row_height = max(height + note_height for _, height, _, note_height in row)
         start_x = config.padding_x + (max_row_width - row_width) / 2
-        for col_index, table_name in enumerate(row):
+        for col_index, (table, height, note_lines, note_height) in enumerate(row):
             x = float(start_x + col_index * (config.table_width + config.gap_x))
-            table = schema[table_name]
-            note_lines, note_height = note_info[table_name]
             layouts.append(
                 TableLayout(
                     table=table,
                     x=x,
                     y=current_y,
                     width=float(config.table_width),
-                    height=table_heights[table_name],
+                    height=height,
                     note_lines=note_lines,
                     note_height=note_height,
                 )
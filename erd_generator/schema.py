@@ -13,6 +13,16 @@ class Column:
     data_type: str = ""
     nullable: bool = True
     is_primary_key: bool = False
+    # Lowercased name cached once; every lookup compares case-insensitively
+    # and re-lowering per comparison dominates schema manipulation.
+    _lc_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._lc_name = self.name.lower()
+
+    def rename(self, new_name: str) -> None:
+        self.name = new_name
+        self._lc_name = new_name.lower()
 
 
 @dataclass
@@ -52,13 +62,57 @@ class Table:
     indexes: List[Index] = field(default_factory=list)
     constraint_types: Dict[str, str] = field(default_factory=dict)
     primary_key_name: Optional[str] = None
+    # Lazily-built index of (columns, ref_table, ref_columns) keys for O(1)
+    # duplicate checks; None means "rebuild on next access".
+    _fk_keys: Optional[Set[Tuple[Tuple[str, ...], str, Tuple[str, ...]]]] = field(
+        default=None, init=False, repr=False
+    )
+    # Lookup index over columns keyed by lowercased name; self.columns stays
+    # the ordered source of truth and the dict is rebuilt whenever the two
+    # fall out of step (e.g. callers mutating the list directly).
+    _by_lc_name: Dict[str, Column] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Name-based lookups over named constraints, validated against the list
+    # length so external list mutations trigger a rebuild; the recorded size
+    # is -1 while no index has been built yet.
+    _fk_by_name: Dict[str, ForeignKey] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _fk_by_name_size: int = field(default=-1, init=False, repr=False, compare=False)
+    _index_by_name: Dict[str, Index] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _index_by_name_size: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _fk_name_index(self) -> Dict[str, ForeignKey]:
+        if self._fk_by_name_size != len(self.foreign_keys):
+            self._fk_by_name = {fk.name.lower(): fk for fk in self.foreign_keys if fk.name}
+            self._fk_by_name_size = len(self.foreign_keys)
+        return self._fk_by_name
+
+    def _index_name_index(self) -> Dict[str, Index]:
+        if self._index_by_name_size != len(self.indexes):
+            self._index_by_name = {idx.name.lower(): idx for idx in self.indexes if idx.name}
+            self._index_by_name_size = len(self.indexes)
+        return self._index_by_name
+
+    def foreign_key_keys(self) -> Set[Tuple[Tuple[str, ...], str, Tuple[str, ...]]]:
+        """Return the set of existing foreign-key identity keys.
+
+        Built on first access and kept up to date by ``add_foreign_key``;
+        mutations that remove or rewrite foreign keys invalidate it so the
+        next access rebuilds from ``foreign_keys``.
+        """
+        keys = self._fk_keys
+        if keys is None:
+            keys = {(fk.columns, fk.ref_table, fk.ref_columns) for fk in self.foreign_keys}
+            self._fk_keys = keys
+        return keys
+
+    def invalidate_foreign_key_keys(self) -> None:
+        self._fk_keys = None
 
     def get_column(self, column_name: str) -> Optional[Column]:
-        target = column_name.lower()
-        for column in self.columns:
-            if column.name.lower() == target:
-                return column
-        return None
+        index = self._by_lc_name
+        if len(index) != len(self.columns):
+            index = {column._lc_name: column for column in self.columns}
+            self._by_lc_name = index
+        return index.get(column_name.lower())
 
     def add_column(self, column: Column) -> None:
         existing = self.get_column(column.name)
@@ -68,6 +122,7 @@ class Table:
             existing.is_primary_key = column.is_primary_key
         else:
             self.columns.append(column)
+            self._by_lc_name[column._lc_name] = column
         if column.is_primary_key:
             self.primary_key.add(column.name)
         self.sync_primary_key_flags()
@@ -80,10 +135,20 @@ class Table:
         elif foreign_key.name:
             foreign_key.name = foreign_key.name.lower()
             self.constraint_types[foreign_key.name] = "foreign_key"
+        # Validate the name index before maintaining it: sites that shrink
+        # foreign_keys without touching the recorded size (drop_column, DROP
+        # TABLE cleanup, CREATE TABLE re-ingestion) would otherwise leave a
+        # stale dict that a later append resynchronizes by length alone.
+        lookup = self._fk_name_index()
+        self._fk_by_name_size += 1
+        if foreign_key.name:
+            lookup[foreign_key.name] = foreign_key
         self.foreign_keys.append(foreign_key)
+        if self._fk_keys is not None:
+            self._fk_keys.add((foreign_key.columns, foreign_key.ref_table, foreign_key.ref_columns))
 
     def set_primary_key(self, columns: Iterable[str], constraint_name: Optional[str] = None) -> None:
-        self.primary_key = {column for column in columns}
+        self.primary_key = set(columns)
         if constraint_name:
             key = constraint_name.lower()
             self.constraint_types[key] = "primary_key"
@@ -104,12 +169,7 @@ class Table:
         elif index.name:
             name_key = index.name.lower()
             index.name = name_key
-        existing = None
-        if name_key:
-            for idx in self.indexes:
-                if (idx.name or "").lower() == name_key:
-                    existing = idx
-                    break
+        existing = self._index_name_index().get(name_key) if name_key else None
         if existing:
             existing.columns = index.columns
             existing.expression_columns = index.expression_columns
@@ -118,23 +178,32 @@ class Table:
             existing.method = index.method
             existing.where = index.where
         else:
+            if self._index_by_name_size == len(self.indexes):
+                self._index_by_name_size += 1
+                if name_key:
+                    self._index_by_name[name_key] = index
             self.indexes.append(index)
 
     def drop_column(self, column_name: str) -> None:
         target = column_name.lower()
-        self.columns = [column for column in self.columns if column.name.lower() != target]
+        self.columns = [column for column in self.columns if column._lc_name != target]
+        self._by_lc_name.pop(target, None)
         self.primary_key = {col for col in self.primary_key if col.lower() != target}
-        fk_names = {
-            fk.name
-            for fk in self.foreign_keys
-            if fk.name and target in {col.lower() for col in fk.columns}
-        }
-        self.foreign_keys = [
-            fk for fk in self.foreign_keys if target not in {col.lower() for col in fk.columns}
-        ]
-        for name in fk_names:
-            if name:
-                self.constraint_types.pop(name.lower(), None)
+        # One pass over the foreign keys, lowering each FK's columns once
+        # instead of once for the name collection and once for the filter.
+        removed_fk_names: List[str] = []
+        kept_fks: List[ForeignKey] = []
+        for fk in self.foreign_keys:
+            if target in {col.lower() for col in fk.columns}:
+                if fk.name:
+                    removed_fk_names.append(fk.name)
+            else:
+                kept_fks.append(fk)
+        if len(kept_fks) != len(self.foreign_keys):
+            self.foreign_keys = kept_fks
+            self._fk_keys = None
+        for name in removed_fk_names:
+            self.constraint_types.pop(name.lower(), None)
         self.indexes = [
             idx
             for idx in self.indexes
@@ -162,9 +231,18 @@ class Table:
             self.primary_key_name = None
             self.sync_primary_key_flags()
         elif constraint_type == "foreign_key":
-            self.foreign_keys = [fk for fk in self.foreign_keys if (fk.name or "").lower() != key]
+            # The name index maps each name to a single FK, but duplicates can
+            # accumulate (concatenated migration streams, an intervening drop
+            # the parser could not handle), so removal filters by name to take
+            # every bearer with it rather than just the indexed one.
+            if self._fk_name_index().pop(key, None) is not None:
+                self.foreign_keys = [fk for fk in self.foreign_keys if (fk.name or "").lower() != key]
+                self._fk_by_name_size = len(self.foreign_keys)
+                self._fk_keys = None
         elif constraint_type == "unique":
-            self.indexes = [idx for idx in self.indexes if (idx.name or "").lower() != key]
+            if self._index_name_index().pop(key, None) is not None:
+                self.indexes = [idx for idx in self.indexes if (idx.name or "").lower() != key]
+                self._index_by_name_size = len(self.indexes)
 
     def rename_constraint(self, old_name: str, new_name: str) -> None:
         old_key = old_name.lower()
@@ -176,21 +254,29 @@ class Table:
         if constraint_type == "primary_key":
             self.primary_key_name = new_key
         elif constraint_type == "foreign_key":
+            # Rename the first bearer of the name; the index keeps the last
+            # when duplicates exist, so walk the list and invalidate it (the
+            # length does not change, so size validation alone would miss it).
             for fk in self.foreign_keys:
                 if (fk.name or "").lower() == old_key:
                     fk.name = new_key
+                    self._fk_by_name_size = -1
                     break
         elif constraint_type == "unique":
             for idx in self.indexes:
                 if (idx.name or "").lower() == old_key:
                     idx.name = new_key
+                    self._index_by_name_size = -1
                     break
 
     def rename_column(self, old_name: str, new_name: str) -> None:
         old_key = old_name.lower()
         for column in self.columns:
-            if column.name.lower() == old_key:
-                column.name = new_name
+            if column._lc_name == old_key:
+                column.rename(new_name)
+                renamed = self._by_lc_name.pop(old_key, None)
+                if renamed is not None:
+                    self._by_lc_name[column._lc_name] = column
         updated_pk: Set[str] = set()
         for column in self.primary_key:
             if column.lower() == old_key:
@@ -202,6 +288,7 @@ class Table:
             fk.columns = tuple(new_name if col.lower() == old_key else col for col in fk.columns)
             if fk.ref_table == self.name:
                 fk.ref_columns = tuple(new_name if col.lower() == old_key else col for col in fk.ref_columns)
+        self._fk_keys = None
         for idx in self.indexes:
             columns = list(idx.columns)
             column_names = list(idx.column_names or ())
@@ -219,33 +306,34 @@ class Table:
         self.sync_primary_key_flags()
 
     def drop_index(self, index_name: str) -> bool:
+        # Misses are the common case (the parser probes every table), so the
+        # name index answers those in O(1); hits filter by name to drop every
+        # duplicate bearer, not just the indexed one.
         key = index_name.lower()
-        removed = False
-        remaining = []
-        for idx in self.indexes:
-            if (idx.name or "").lower() == key:
-                removed = True
-                continue
-            remaining.append(idx)
-        if removed:
-            self.indexes = remaining
-            self.constraint_types.pop(key, None)
-        return removed
+        if self._index_name_index().pop(key, None) is None:
+            return False
+        self.indexes = [idx for idx in self.indexes if (idx.name or "").lower() != key]
+        self._index_by_name_size = len(self.indexes)
+        self.constraint_types.pop(key, None)
+        return True
 
     def rename_index(self, old_name: str, new_name: str) -> bool:
         old_key = old_name.lower()
+        if old_key not in self._index_name_index():
+            return False
         new_key = new_name.lower()
         for idx in self.indexes:
             if (idx.name or "").lower() == old_key:
                 idx.name = new_key
-                self.constraint_types[new_key] = self.constraint_types.pop(old_key, "index")
-                return True
-        return False
+                self._index_by_name_size = -1
+                break
+        self.constraint_types[new_key] = self.constraint_types.pop(old_key, "index")
+        return True
 
     def sync_primary_key_flags(self) -> None:
         pk_columns = {col.lower() for col in self.primary_key}
         for column in self.columns:
-            column.is_primary_key = column.name.lower() in pk_columns
+            column.is_primary_key = column._lc_name in pk_columns
 
 
 Schema = Dict[str, Table]
@@ -268,9 +356,13 @@ def rename_table(schema: Schema, old_name: str, new_name: str) -> None:
     table.name = new_name
     schema[new_name] = table
     for other in schema.values():
+        changed = False
         for fk in other.foreign_keys:
             if fk.ref_table == old_name:
                 fk.ref_table = new_name
+                changed = True
+        if changed:
+            other.invalidate_foreign_key_keys()
 
 
 def rename_column_in_schema(schema: Schema, table_name: str, old_name: str, new_name: str) -> None:
@@ -278,14 +370,24 @@ def rename_column_in_schema(schema: Schema, table_name: str, old_name: str, new_
     if not table:
         return
     table.rename_column(old_name, new_name)
+    old_lc = old_name.lower()
     for other in schema.values():
         if other.name == table_name:
             continue
+        changed = False
         for fk in other.foreign_keys:
-            if fk.ref_table == table_name:
-                fk.ref_columns = tuple(
-                    new_name if col.lower() == old_name.lower() else col for col in fk.ref_columns
-                )
+            if fk.ref_table != table_name:
+                continue
+            # Only rebuild the tuple when the renamed column actually appears
+            # in it; most FKs against the table reference other columns.
+            if all(col.lower() != old_lc for col in fk.ref_columns):
+                continue
+            fk.ref_columns = tuple(
+                new_name if col.lower() == old_lc else col for col in fk.ref_columns
+            )
+            changed = True
+        if changed:
+            other.invalidate_foreign_key_keys()
 
 
 def describe_table_notes(table: Table) -> List[str]:
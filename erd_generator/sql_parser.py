@@ -1,11 +1,10 @@
 """SQL parsing helpers backed by sqlglot."""
 from __future__ import annotations
 
-import glob
-import os
 import re
 from dataclasses import dataclass
-from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
 import sqlglot
@@ -22,6 +21,12 @@ from .schema import (
     rename_table,
 )
 
+FK_HINT_RE = re.compile(
+    r"--\s*FK\s+(?P<table>[^(]+?)\s*\((?P<cols>[^)]*)\)",
+    re.IGNORECASE,
+)
+FK_HINT_COLUMN_RE = re.compile(r'^\s*(?P<name>"[^"]+"|[A-Za-z_][\w]*)')
+
 RENAME_CONSTRAINT_RE = re.compile(
     r"""
     ^\s*ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?(?P<table>"[^"]+"|\S+)\s+
@@ -35,6 +40,10 @@ RENAME_CONSTRAINT_RE = re.compile(
 # Normalisation helpers
 
 
+# The same identifiers recur constantly across a migration stream (a table
+# name appears in its CREATE, every FK referencing it and every ALTER), so
+# memoising the pure normalisation skips the strip/split/lower allocations.
+@lru_cache(maxsize=4096)
 def _normalize_identifier(text: str) -> str:
     text = text.strip()
     if not text:
@@ -302,18 +311,12 @@ def _ingest_table_element(table: Table, element: exp.Expression) -> None:
 
 def _extract_fk_hints(raw_sql: str) -> List[Tuple[str, str, Tuple[str, ...]]]:
     hints: List[Tuple[str, str, Tuple[str, ...]]] = []
-    fk_pattern = re.compile(
-        r"--\s*FK\s+(?P<table>[^(]+?)\s*\((?P<cols>[^)]*)\)",
-        re.IGNORECASE,
-    )
-    column_pattern = re.compile(r'^\s*(?P<name>"[^"]+"|[A-Za-z_][\w]*)')
-
     for line in raw_sql.splitlines():
-        match = fk_pattern.search(line)
+        match = FK_HINT_RE.search(line)
         if not match:
             continue
         before_comment = line[: match.start()]
-        column_match = column_pattern.match(before_comment)
+        column_match = FK_HINT_COLUMN_RE.match(before_comment)
         if not column_match:
             continue
         local_column = _column_name(column_match.group("name"))
@@ -356,6 +359,7 @@ def _handle_create_table(statement: exp.Create, schema: Schema, raw_sql: Optiona
     table.indexes.clear()
     table.constraint_types.clear()
     table.primary_key_name = None
+    table.invalidate_foreign_key_keys()
 
     for element in schema_expr.expressions or []:
         _ingest_table_element(table, element)
@@ -457,6 +461,7 @@ def _handle_drop_table(table_name: str, schema: Schema) -> None:
         if not removed:
             continue
         table.foreign_keys = [fk for fk in table.foreign_keys if fk.ref_table != table_name]
+        table.invalidate_foreign_key_keys()
         for fk in removed:
             if fk.name:
                 table.constraint_types.pop(fk.name.lower(), None)
@@ -566,87 +571,89 @@ def _handle_command(command: exp.Command, schema: Schema) -> bool:
 # Public API
 
 
+# Tokens that can change splitting state: quote openers, comment openers and
+# the statement separator itself. Everything between them is copied verbatim,
+# so the splitter only needs to visit these positions.
+_SPLIT_TOKEN_RE = re.compile(r"'|\"|--|/\*|;")
+
+
 def _split_sql_statements(sql: str) -> List[str]:
     statements: List[str] = []
-    buf: List[str] = []
-    in_single = False
-    in_double = False
-    i = 0
     length = len(sql)
-    while i < length:
-        ch = sql[i]
-        next_two = sql[i : i + 2]
-        if ch == "'" and not in_double:
-            if in_single and i + 1 < length and sql[i + 1] == "'":
-                buf.append("''")
-                i += 2
-                continue
-            in_single = not in_single
-            buf.append(ch)
-            i += 1
-            continue
-        if ch == '"' and not in_single:
-            if in_double and i + 1 < length and sql[i + 1] == '"':
-                buf.append('""')
-                i += 2
-                continue
-            in_double = not in_double
-            buf.append(ch)
-            i += 1
-            continue
-        if not in_single and not in_double and next_two == "--":
-            newline_index = sql.find("\n", i)
-            if newline_index == -1:
-                buf.append(sql[i:])
-                i = length
-                break
-            buf.append(sql[i:newline_index])
-            i = newline_index
-            continue
-        if not in_single and not in_double and next_two == "/*":
-            end_index = sql.find("*/", i + 2)
-            if end_index == -1:
-                buf.append(sql[i:])
-                i = length
+    start = 0  # beginning of the current statement
+    pos = 0  # scan position
+    search = _SPLIT_TOKEN_RE.search
+    find = sql.find
+    while True:
+        match = search(sql, pos)
+        if match is None:
+            break
+        token = match.group()
+        if token == "'" or token == '"':
+            # Skip to the closing quote, treating doubled quotes as escapes;
+            # an unterminated literal swallows the rest of the input, which
+            # matches the previous character-by-character behaviour.
+            pos = match.end()
+            while True:
+                closing = find(token, pos)
+                if closing == -1:
+                    pos = length
+                    break
+                if sql[closing + 1 : closing + 2] == token:
+                    pos = closing + 2
+                    continue
+                pos = closing + 1
                 break
-            end_index += 2
-            buf.append(sql[i:end_index])
-            i = end_index
-            continue
-        if ch == ";" and not in_single and not in_double:
-            statement = "".join(buf).strip()
+        elif token == "--":
+            newline_index = find("\n", match.end())
+            pos = length if newline_index == -1 else newline_index
+        elif token == "/*":
+            end_index = find("*/", match.end())
+            pos = length if end_index == -1 else end_index + 2
+        else:  # ";"
+            statement = sql[start : match.start()].strip()
             if statement:
                 statements.append(statement)
-            buf = []
-            i += 1
-            continue
-        buf.append(ch)
-        i += 1
-    tail = "".join(buf).strip()
+            start = pos = match.end()
+    tail = sql[start:].strip()
     if tail:
         statements.append(tail)
     return statements
 
 
-def parse_schema_from_sql(
-    sql: str,
+# One parsed statement: the raw SQL, the sqlglot expressions (None when the
+# parse failed) and the failure reason to replay in that case.
+_ParsedStatement = Tuple[str, Optional[List[exp.Expression]], Optional[str]]
+
+# Only CREATE/ALTER/DROP statements can affect the schema; data-only
+# migrations (INSERTs, GRANTs, SETs, ...) skip the sqlglot parse entirely.
+_DDL_PREFILTER = re.compile(r"\b(?:CREATE|ALTER|DROP)\b", re.IGNORECASE).search
+
+
+def _parse_sql_statements(sql: str) -> List[_ParsedStatement]:
+    parsed: List[_ParsedStatement] = []
+    for raw_statement in _split_sql_statements(sql):
+        if _DDL_PREFILTER(raw_statement) is None:
+            continue
+        try:
+            expressions = sqlglot.parse(raw_statement, read="postgres")
+        except (ParseError, TokenError) as exc:
+            parsed.append((raw_statement, None, f"Parse error ({exc.__class__.__name__})"))
+            continue
+        parsed.append((raw_statement, expressions, None))
+    return parsed
+
+
+def _apply_parsed_statements(
+    parsed: List[_ParsedStatement],
     schema: Schema,
     *,
     source: Optional[str] = None,
     failures: Optional[List[ParseFailure]] = None,
 ) -> None:
-    if not sql.strip():
-        return
-    for raw_statement in _split_sql_statements(sql):
-        try:
-            expressions = sqlglot.parse(raw_statement, read="postgres")
-        except (ParseError, TokenError) as exc:
-            _record_failure(
-                failures,
-                source,
-                raw_statement,
-                f"Parse error ({exc.__class__.__name__})",
-            )
+    for raw_statement, expressions, parse_error in parsed:
+        if expressions is None:
+            _record_failure(failures, source, raw_statement, parse_error or "Parse error")
             continue
         for statement in expressions:
             if isinstance(statement, exp.Create):
@@ -674,19 +681,48 @@ def parse_schema_from_sql(
         table.sync_primary_key_flags()
 
 
+def parse_schema_from_sql(
+    sql: str,
+    schema: Schema,
+    *,
+    source: Optional[str] = None,
+    failures: Optional[List[ParseFailure]] = None,
+) -> None:
+    if not sql.strip():
+        return
+    _apply_parsed_statements(
+        _parse_sql_statements(sql), schema, source=source, failures=failures
+    )
+
+
+# Parsed migration files keyed by (path, mtime_ns, size); splitting and
+# sqlglot parsing are by far the dominant cost per file, so repeated loads in
+# one process replay the cached statements straight into a fresh schema.
+_PARSE_CACHE: dict[Tuple[str, int, int], List[_ParsedStatement]] = {}
+
+
 def load_schema_from_migrations(path: str) -> Schema:
     schema: Schema = {}
     global _LAST_PARSE_FAILURES
     _LAST_PARSE_FAILURES = []
-    files = sorted(glob.glob(os.path.join(path, "**", "*.sql"), recursive=True))
+    files = sorted(Path(path).glob("**/*.sql"), key=str)
     for file_path in files:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-            parse_schema_from_sql(
-                handle.read(),
-                schema,
-                source=file_path,
-                failures=_LAST_PARSE_FAILURES,
+        source = str(file_path)
+        try:
+            stat = file_path.stat()
+            cache_key: Optional[Tuple[str, int, int]] = (source, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        parsed = _PARSE_CACHE.get(cache_key) if cache_key is not None else None
+        if parsed is None:
+            parsed = _parse_sql_statements(
+                file_path.read_text(encoding="utf-8", errors="ignore")
             )
+            if cache_key is not None:
+                _PARSE_CACHE[cache_key] = parsed
+        _apply_parsed_statements(
+            parsed, schema, source=source, failures=_LAST_PARSE_FAILURES
+        )
     return schema
 
 
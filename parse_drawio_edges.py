@@ -5,29 +5,38 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml
 
+try:  # libyaml's C emitter serialises much faster than the pure-Python one
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper
+
 from erd_generator.drawio_parser import parse_drawio_edges
 
 FATAL_ISSUES = {"missing start table", "missing start column", "missing end table"}
 
+# Issue bits accumulated per edge; the human-readable tuple is only built on
+# the rare path where an edge actually has issues.
+_ISSUE_BITS: Tuple[Tuple[int, str], ...] = (
+    (1, "missing start table"),
+    (2, "missing start column"),
+    (4, "missing end table"),
+    (8, "missing end column"),
+)
+_FATAL_MASK = sum(bit for bit, label in _ISSUE_BITS if label in FATAL_ISSUES)
+
 
 class FlowList(list):
     """List that should be emitted in YAML flow style (e.g. `[a, b, c]`)."""
 
 
-def _register_ordered_dict() -> None:
+def _register_representers() -> None:
     try:
-        yaml.add_representer(
-            OrderedDict,
-            lambda dumper, data: dumper.represent_dict(data.items()),
-            Dumper=yaml.SafeDumper,
-        )
         yaml.add_representer(
             FlowList,
             lambda dumper, data: dumper.represent_sequence(
@@ -35,13 +44,13 @@ def _register_ordered_dict() -> None:
                 data,
                 flow_style=True,
             ),
-            Dumper=yaml.SafeDumper,
+            Dumper=_YamlDumper,
         )
     except Exception:
         pass
 
 
-_register_ordered_dict()
+_register_representers()
 
 
 @dataclass(frozen=True)
@@ -52,11 +61,16 @@ class EdgeAnomaly:
     fatal: bool
 
 
-def _value_or_placeholder(raw: Optional[str], index: int, label: str) -> str:
-    text = (raw or "").strip()
-    if text:
-        return text
-    safe_label = label.upper().replace(" ", "_")
+def _value_or_placeholder(raw: Optional[str], index: int, safe_label: str) -> str:
+    # Almost every edge in a healthy export is fully populated, so return the
+    # value untouched unless it actually has surrounding whitespace; the
+    # placeholder label arrives pre-uppercased so the miss path only formats.
+    if raw:
+        if not raw[0].isspace() and not raw[-1].isspace():
+            return raw
+        text = raw.strip()
+        if text:
+            return text
     return f"__MISSING_{safe_label}_{index}__"
 
 
@@ -83,29 +97,33 @@ def _detect_anomalies(edges: Sequence[Dict[str, str]]) -> List[EdgeAnomaly]:
         end_table = (edge.get("end_table") or "").strip()
         end_column = (edge.get("end_column") or "").strip()
 
-        issues: List[str] = []
+        mask = 0
         if not start_table:
-            issues.append("missing start table")
-        if start_table and not start_column:
-            issues.append("missing start column")
+            mask |= 1
+        elif not start_column:
+            mask |= 2
         if not end_table:
-            issues.append("missing end table")
-        if end_table and not end_column:
-            issues.append("missing end column")
-
-        if issues:
-            fatal = any(issue in FATAL_ISSUES for issue in issues)
-            anomalies.append(EdgeAnomaly(index=idx, edge=edge, issues=tuple(issues), fatal=fatal))
+            mask |= 4
+        elif not end_column:
+            mask |= 8
+
+        if mask:
+            issues = tuple(label for bit, label in _ISSUE_BITS if mask & bit)
+            anomalies.append(
+                EdgeAnomaly(index=idx, edge=edge, issues=issues, fatal=bool(mask & _FATAL_MASK))
+            )
     return anomalies
 
 
 def _build_fk_config(edges: Sequence[Dict[str, str]]) -> dict:
-    config: "OrderedDict[str, dict[str, List[List[str]]]]" = OrderedDict()
+    # Built-in dicts preserve insertion order, so no OrderedDict (or custom
+    # representer for it) is needed.
+    config: Dict[str, Dict[str, List[List[str]]]] = {}
     for idx, edge in enumerate(edges, start=1):
-        start_table = _value_or_placeholder(edge.get("start_table"), idx, "start_table")
-        start_column = _value_or_placeholder(edge.get("start_column"), idx, "start_column")
-        end_table = _value_or_placeholder(edge.get("end_table"), idx, "end_table")
-        end_column = _value_or_placeholder(edge.get("end_column"), idx, "end_column")
+        start_table = _value_or_placeholder(edge.get("start_table"), idx, "START_TABLE")
+        start_column = _value_or_placeholder(edge.get("start_column"), idx, "START_COLUMN")
+        end_table = _value_or_placeholder(edge.get("end_table"), idx, "END_TABLE")
+        end_column = _value_or_placeholder(edge.get("end_column"), idx, "END_COLUMN")
         table_entry = config.setdefault(start_table, {"fks": []})
         table_entry["fks"].append(FlowList([start_column, end_table, end_column]))
     return config
@@ -119,10 +137,13 @@ def _log_anomalies(anomalies: Sequence[EdgeAnomaly]) -> None:
     if not anomalies:
         logging.info("No parse anomalies detected.")
         return
-    fatal = [a for a in anomalies if a.fatal]
-    non_fatal = [a for a in anomalies if not a.fatal]
+    fatal_count = 0
     for anomaly in anomalies:
-        log_fn = logging.warning if anomaly.fatal else logging.info
+        if anomaly.fatal:
+            fatal_count += 1
+            log_fn = logging.warning
+        else:
+            log_fn = logging.info
         log_fn(
             "Edge %d %s issues: %s",
             anomaly.index,
@@ -132,8 +153,8 @@ def _log_anomalies(anomalies: Sequence[EdgeAnomaly]) -> None:
     logging.info(
         "Detected %d edges with issues (%d fatal, %d non-fatal).",
         len(anomalies),
-        len(fatal),
-        len(non_fatal),
+        fatal_count,
+        len(anomalies) - fatal_count,
     )
 
 
@@ -201,7 +222,7 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if not config:
         logging.error("No usable edges were detected; FK config YAML will be empty.")
-    yaml.safe_dump(config, sys.stdout, sort_keys=False, allow_unicode=True)
+    yaml.dump(config, sys.stdout, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
     return 0
 
 